@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from threading import Lock, RLock
 
 from shared.utils.config_loader import network_cfg, game_cfg
+from shared.utils.compression import decode_payload
 from shared.packets import Packet, ConnectPacket, MovePacket, SkillPacket, GetGameStatePacket, \
     PlayerIdPacket, GameStatePacket, UsernameTakenPacket, ServerFullPacket, PingPacket, PongPacket
 
@@ -98,7 +99,10 @@ class Network:
                     
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            
+            if network_cfg['socket']['tcp_nodelay']:
+                # Move and state requests are sent back to back; don't let Nagle hold the second one
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             # Platform-specific keepalive settings
             if hasattr(socket, 'TCP_KEEPIDLE') and hasattr(socket, 'TCP_KEEPINTVL') and hasattr(socket, 'TCP_KEEPCNT'):
                 # Linux
@@ -160,7 +164,7 @@ class Network:
                 
                 # Send connect packet
                 connect_packet = ConnectPacket(name=name)
-                self._send_message(connect_packet.to_json().encode('utf-8'))
+                self._send_message(connect_packet.to_bytes())
                 
                 # Get response
                 response_data = self._recv_message()
@@ -218,7 +222,10 @@ class Network:
                 raise ProtocolError(f"Message too large: {msg_length} bytes")
                 
             # Get message data
-            return self._recv_all(msg_length)
+            data = self._recv_all(msg_length)
+            if not data:
+                return None
+            return decode_payload(data)
             
         except (socket.error, OSError) as e:
             self._handle_connection_error(e)
@@ -345,7 +352,7 @@ class Network:
             
         with self._lock:
             try:
-                message = packet.to_json().encode('utf-8')
+                message = packet.to_bytes()
                 self._send_message(message)
                 return True
             except (TypeError, json.JSONEncodeError) as e:
@@ -1,16 +1,15 @@
 import socket
 import threading
 import json
-import time
 import weakref
 import logging
-import select
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import asdict
 from shared.utils.config_loader import network_cfg, game_cfg, world_cfg, skills_cfg
 
 from shared.entities.player import Player
 from shared.entities.food import Food
+from shared.utils.compression import encode_payload
 from shared.packets import Packet, ConnectPacket, MovePacket, SkillPacket, GetGameStatePacket, \
     PlayerIdPacket, GameStatePacket, UsernameTakenPacket, ServerFullPacket, PingPacket, PongPacket
 
@@ -22,8 +21,8 @@ class ClientThread(threading.Thread):
         self.server_ref = server_ref
         self.conn = conn
         self.client_id = client_id
+        self.username = None  # Set once the username has been reserved on the server
         self.running = True
-        self.last_activity = time.time()
 
     def run(self):
         try:
@@ -59,17 +58,19 @@ class ClientThread(threading.Thread):
             name = initial_packet.name
 
             with server.lock:
-                if any(p.name == name for p in server.players.values()):
+                if name in server.player_names:
                     logger.warning(f"[ERROR] Client {self.client_id}: Username '{name}' is already taken.")
-                    self._send_message(UsernameTakenPacket(message=network_cfg['protocol']['username_taken_message']).to_json().encode('utf-8'))
+                    self._send_packet(UsernameTakenPacket(message=network_cfg['protocol']['username_taken_message']))
                     self.running = False
                     return
+                server.player_names.add(name)
+                self.username = name
 
             logger.info(f"[LOG] Player '{name}' (ID: {self.client_id}) connected.")
             
             # Send player ID back to client
             player_id_packet = PlayerIdPacket(player_id=str(self.client_id))
-            self._send_message(player_id_packet.to_json().encode('utf-8'))
+            self._send_packet(player_id_packet)
 
             x, y = server.game_manager.get_start_location(server.players)
             server.players[self.client_id] = Player(self.client_id, name, x, y)
@@ -85,31 +86,35 @@ class ClientThread(threading.Thread):
             return
 
         # Continue with message handling loop
-        buffer = b''
+        # The socket timeout is the idle deadline: recv() only returns early for
+        # data, so an idle client costs one wakeup when it expires instead of a
+        # poll every second. Shutdown is signalled by stop() closing the socket.
+        self.conn.settimeout(network_cfg['client_timeout'])
+        # Received bytes accumulate in one growable buffer; consumed frames are
+        # skipped via read_pos and only compacted once they make up half of it
+        buffer = bytearray()
+        read_pos = 0
         while self.running and server.running:
             try:
-                ready = select.select([self.conn], [], [], 1.0)
-                if not ready[0]:
-                    # Check for timeout
-                    if time.time() - self.last_activity > network_cfg['client_timeout']:
-                        logger.warning(f"Client {self.client_id} timed out")
-                        break
-                    continue
+                try:
+                    data = self.conn.recv(network_cfg['buffer_size'])
+                except socket.timeout:
+                    logger.warning(f"Client {self.client_id} timed out")
+                    break
 
-                data = self.conn.recv(network_cfg['buffer_size'])
                 if not data:
                     break
 
-                self.last_activity = time.time()
-                buffer += data
+                buffer.extend(data)
                 
-                while len(buffer) >= 4 and self.running:
-                    msg_length = int.from_bytes(buffer[:4], 'big')
-                    if len(buffer) < 4 + msg_length:
+                while len(buffer) - read_pos >= 4 and self.running:
+                    msg_length = int.from_bytes(buffer[read_pos:read_pos+4], 'big')
+                    msg_end = read_pos + 4 + msg_length
+                    if len(buffer) < msg_end:
                         break
                         
-                    message_bytes = buffer[4:4+msg_length]
-                    buffer = buffer[4+msg_length:]
+                    message_bytes = buffer[read_pos+4:msg_end]
+                    read_pos = msg_end
                     
                     try:
                         packet = Packet.from_json(message_bytes.decode('utf-8'))
@@ -117,9 +122,21 @@ class ClientThread(threading.Thread):
                     except (json.JSONDecodeError, ValueError) as e:
                         logger.error(f"Client {self.client_id}: Invalid packet received: {e}")
                         # Optionally send an error packet back to the client
+
+                if read_pos == len(buffer):
+                    buffer.clear()
+                    read_pos = 0
+                elif read_pos > len(buffer) // 2:
+                    del buffer[:read_pos]
+                    read_pos = 0
                         
             except (socket.timeout, ConnectionResetError, ConnectionAbortedError):
                 break
+            except OSError as e:
+                # Raised by recv() once stop() has closed the socket
+                if self.running:
+                    logger.error(f"Error handling client {self.client_id}: {e}", exc_info=True)
+                break
             except Exception as e:
                 logger.error(f"Error handling client {self.client_id}: {e}", exc_info=True)
                 break
@@ -138,27 +155,26 @@ class ClientThread(threading.Thread):
         elif isinstance(packet, GetGameStatePacket):
             self._send_game_state(server)
         elif isinstance(packet, PingPacket):
-            self._send_message(PongPacket().to_json().encode('utf-8'))
+            self._send_packet(PongPacket())
         elif isinstance(packet, PlayerIdPacket): # Reconnect packet
             logger.info(f"Client {self.client_id} reconnected with ID: {packet.player_id}")
         else:
             logger.warning(f"Client {self.client_id}: Unhandled packet type: {packet.type}")
 
     def _send_game_state(self, server):
-        with server.lock:
-            if self.client_id not in server.players:
-                return
-                
-            game_state = GameStatePacket(
-                balls=[b.to_dict() for b in server.balls],
-                players=server.game_manager.get_serializable_players(),
-                game_time=time.time() - server.start_time if server.start else 0
-            )
-            response = game_state.to_json().encode('utf-8')
-            try:
-                self._send_message(response)
-            except (ConnectionResetError, BrokenPipeError):
-                self.running = False
+        if self.client_id not in server.players:
+            return
+
+        # The game loop publishes an encoded snapshot every tick, so serving it
+        # needs no lock and a slow client never stalls the game loop
+        try:
+            self._send_message(server.game_manager.snapshot)
+        except (ConnectionResetError, BrokenPipeError):
+            self.running = False
+
+    def _send_packet(self, packet: Packet) -> None:
+        """Serialize, encode and send a packet."""
+        self._send_message(encode_payload(packet.to_bytes()))
 
     def _send_message(self, data: bytes) -> None: 
         """Send a message with length prefix."""
@@ -200,6 +216,11 @@ class ClientThread(threading.Thread):
 
     def stop(self):
         self.running = False
+        try:
+            # shutdown() wakes a recv() blocked in another thread; close() alone does not
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         try:
             self.conn.close()
         except:
@@ -210,6 +231,8 @@ class ClientThread(threading.Thread):
         server = self.server_ref()
         if server:
             with server.lock:
+                if self.username is not None:
+                    server.player_names.discard(self.username)
                 if self.client_id in server.players:
                     player_name = server.players[self.client_id].name
                     del server.players[self.client_id]
@@ -0,0 +1,46 @@
+"""Player-vs-ball eating kernel applied to the ball arrays.
+
+Compiled with numba when it is installed, with an equivalent NumPy fallback.
+The numba kernel is compiled eagerly at import from an explicit signature, so
+it never stalls a tick while the game lock is held.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _find_eaten_balls_numpy(xs, ys, rs, bx, by, br, owner):
+    """
+    Find which player, if any, eats each ball and store its index in owner.
+
+    A ball is eaten once it lies completely inside a player:
+    distance <= |player.radius - ball.radius|. A ball covered by several
+    players goes to the first of them. Balls nobody eats get -1.
+    """
+    dx = bx - xs[:, None]
+    dy = by - ys[:, None]
+    reach = rs[:, None] - br
+    hit = dx*dx + dy*dy <= reach*reach
+    owner[:] = np.where(hit.any(axis=0), hit.argmax(axis=0), -1)
+
+
+if NUMBA_AVAILABLE:
+    @njit('void(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int64[::1])',
+          fastmath=True, cache=True)
+    def find_eaten_balls(xs, ys, rs, bx, by, br, owner):
+        for j in range(bx.shape[0]):
+            owner[j] = -1
+            for i in range(xs.shape[0]):
+                dx = bx[j] - xs[i]
+                dy = by[j] - ys[i]
+                reach = rs[i] - br[j]
+                if dx*dx + dy*dy <= reach*reach:
+                    owner[j] = i
+                    break
+else:
+    find_eaten_balls = _find_eaten_balls_numpy
@@ -1,13 +1,18 @@
-import random
 import math
 import time
 import logging
 from typing import Dict, List, Tuple
 from threading import RLock
 
+import numpy as np
+
 from shared.utils.config_loader import server_cfg, world_cfg, game_cfg, food_cfg, skills_cfg
 from shared.entities.player import Player
 from shared.entities.food import Food
+from shared.packets import GameStatePacket
+from shared.utils.compression import encode_payload
+from server.skills_kernels import apply_push, apply_pull
+from server.collision_kernels import find_eaten_balls
 
 logger = logging.getLogger(__name__)
 
@@ -16,104 +21,276 @@ class GameManager:
         self.players = players
         self.balls = balls
         self.world_dimensions = world_dimensions
+        # World bounds cached for the clamps in the skill passes
+        self._padding = world_cfg['boundary']['padding']
+        self._world_w, self._world_h = world_dimensions
         self.player_start_radius = player_start_radius
         self.player_colors = player_colors
         self.lock = lock
         self.start = start
         self.start_time = start_time
+
+        # Ball positions and radii mirrored into parallel arrays so collision and
+        # skill passes run vectorized; index i always describes self.balls[i]
+        self.balls_x = np.empty(0, dtype=np.float64)
+        self.balls_y = np.empty(0, dtype=np.float64)
+        self.balls_r = np.empty(0, dtype=np.float64)
+        # Per-tick scratch buffers sized with the ball arrays, so the steady-state
+        # tick allocates no ball-length arrays
+        self._owner_scratch = np.empty(0, dtype=np.int64)
+        self._moved_scratch = np.empty(0, dtype=bool)
+
+        # Batched random draws for spawning balls
+        self._rng = np.random.default_rng()
+
+        # Cell size of the occupancy grid used to find free spawn locations
+        self.spawn_cell_size = max(2 * player_start_radius, 1)
+
+        # Ids of players with a push or pull skill running; update_skills only visits these
+        self._active_skill_players = set()
+
+        # Monotonic timestamp of the current tick, supplied by the game loop
+        self.tick_time = time.monotonic()
+
+        # Encoded game state published at the end of every tick. Client threads
+        # read this reference without taking the lock.
+        self.snapshot = b''
         
         self._initialize_food()
+        self._publish_snapshot(self._collect_game_state())
 
     def _initialize_food(self) -> None:
         """Initialize food items in the game world."""
-        world_w, world_h = self.world_dimensions
-        padding = world_cfg['boundary']['padding']
-        
-        for _ in range(server_cfg['ball_count']['min'], server_cfg['ball_count']['max']):
-            x = random.randint(padding, world_w - padding)
-            y = random.randint(padding, world_h - padding)
-            color = random.choice(self.player_colors)
-            self.balls.append(Food(x, y, color))
+        self._spawn_balls(server_cfg['ball_count']['max'] - server_cfg['ball_count']['min'])
+
+    def _spawn_balls(self, n):
+        """Add n balls at random positions, drawing all positions and colours in one batch."""
+        padding = self._padding
+        colors = self.player_colors
+        xs = self._rng.integers(padding, self._world_w - padding, n, endpoint=True).tolist()
+        ys = self._rng.integers(padding, self._world_h - padding, n, endpoint=True).tolist()
+        color_idx = self._rng.integers(0, len(colors), n).tolist()
+        self._add_balls([Food(x, y, colors[c]) for x, y, c in zip(xs, ys, color_idx)])
+
+    def _ensure_ball_capacity(self, n):
+        """Grow the ball arrays so they can hold at least n balls."""
+        capacity = len(self.balls_x)
+        if n <= capacity:
+            return
+        capacity = max(n, 2 * capacity)
+        count = len(self.balls)
+        for name in ('balls_x', 'balls_y', 'balls_r'):
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[:count] = getattr(self, name)[:count]
+            setattr(self, name, grown)
+        self._owner_scratch = np.empty(capacity, dtype=np.int64)
+        self._moved_scratch = np.empty(capacity, dtype=bool)
+
+    def _add_balls(self, new_balls):
+        """Append balls to the shared list and mirror them into the arrays."""
+        start = len(self.balls)
+        end = start + len(new_balls)
+        self._ensure_ball_capacity(end)
+        self.balls_x[start:end] = [b.x for b in new_balls]
+        self.balls_y[start:end] = [b.y for b in new_balls]
+        self.balls_r[start:end] = [b.radius for b in new_balls]
+        self.balls.extend(new_balls)
+
+    def tick(self, now):
+        """Advance the game simulation by one server tick.
+
+        Args:
+            now: time.monotonic() reading taken by the game loop for this tick
+        """
+        with self.lock:
+            self.tick_time = now
+
+            # Update all players (age and size)
+            for player in self.players.values():
+                player.update(now)
+
+            self.update_skills()
+            self.check_collision(self.players, self.balls)
+            self.player_collision(self.players)
+
+            # Maintain ball count
+            min_balls = server_cfg['ball_count']['min']
+            max_balls = server_cfg['ball_count']['max']
+            if len(self.balls) < min_balls:
+                to_add = min(max_balls - len(self.balls), max_balls - min_balls + 1)
+                if to_add > 0:
+                    self.create_balls(to_add)
+
+            game_state = self._collect_game_state()
+
+        # Serialize and compress after releasing the lock
+        self._publish_snapshot(game_state)
+
+    def _collect_game_state(self):
+        """Capture the current game state as a packet. Must be called with the lock held."""
+        return GameStatePacket(
+            balls=[b.to_dict() for b in self.balls],
+            players=self.get_serializable_players(),
+            game_time=max(0, self.tick_time - self.start_time) if self.start else 0
+        )
+
+    def _publish_snapshot(self, game_state):
+        """Encode a captured game state and make it the one served to clients.
+
+        Every client shares one encoding per tick, so serialization cost does not
+        scale with the number of clients.
+        """
+        self.snapshot = encode_payload(game_state.to_bytes())
 
     def check_collision(self, players, balls):
         """Check if any player has collided with any of the balls."""
-        balls_to_remove = set()
+        n = len(balls)
+        if not n:
+            return
+        player_list = tuple(players.values())
+        if not player_list:
+            return
+        count = len(player_list)
+        growth_amount = food_cfg['growth_amount']
+        bx, by, br = self.balls_x[:n], self.balls_y[:n], self.balls_r[:n]
+        xs = np.fromiter((p.x for p in player_list), np.float64, count)
+        ys = np.fromiter((p.y for p in player_list), np.float64, count)
+        rs = np.fromiter((p.radius for p in player_list), np.float64, count)
         
-        for player in players.values():
-            for i, ball in enumerate(balls):
-                if i in balls_to_remove:
-                    continue
-                    
-                if player.is_colliding(ball):
-                    player.increase_score(food_cfg['growth_amount'])
-                    balls_to_remove.add(i)
+        # Index of the player eating each ball, or -1
+        owner = self._owner_scratch[:n]
+        find_eaten_balls(xs, ys, rs, bx, by, br, owner)
+        eaten = owner >= 0
+        if not eaten.any():
+            return
         
-        # Remove collided balls in reverse order to avoid index shifting
-        for i in sorted(balls_to_remove, reverse=True):
-            if i < len(balls):
-                del balls[i]
+        for player, eaten_count in zip(player_list, np.bincount(owner[eaten], minlength=count).tolist()):
+            if eaten_count:
+                player.increase_score(growth_amount * eaten_count)
+        
+        # Ball order is irrelevant, so each hole below the new end is filled by a
+        # surviving ball from the tail; only O(eaten) entries move
+        remaining = n - int(np.count_nonzero(eaten))
+        eaten_idx = np.flatnonzero(eaten)
+        holes = eaten_idx[eaten_idx < remaining]
+        tail = np.flatnonzero(~eaten[remaining:]) + remaining
+        for arr in (self.balls_x, self.balls_y, self.balls_r):
+            arr[holes] = arr[tail]
+        for hole, survivor in zip(holes.tolist(), tail.tolist()):
+            balls[hole] = balls[survivor]
+        del balls[remaining:]
 
     def player_collision(self, players):
         """Check for player collisions and handle them based on size."""
-        player_list = list(players.values())
+        player_list = tuple(players.values())
+        count = len(player_list)
+        if count < 2:
+            return
+        eating_threshold = game_cfg['player_eating_threshold']
+
+        # Find every pair where one player could eat the other at once from the
+        # pairwise matrices: the smaller must lie completely inside the larger
+        # and the size ratio must exceed the threshold
+        xs = np.fromiter((p.x for p in player_list), np.float64, count)
+        ys = np.fromiter((p.y for p in player_list), np.float64, count)
+        rs = np.fromiter((p.radius for p in player_list), np.float64, count)
+        dx = xs[:, None] - xs
+        dy = ys[:, None] - ys
+        gap = rs[:, None] - rs
+        larger_r = np.maximum(rs[:, None], rs)
+        smaller_r = np.minimum(rs[:, None], rs)
+        can_eat = (dx*dx + dy*dy <= gap*gap) & (larger_r > smaller_r * eating_threshold)
+        pair_i, pair_j = np.nonzero(np.triu(can_eat, k=1))
         
-        for i, player1 in enumerate(player_list):
-            for j in range(i + 1, len(player_list)):
-                player2 = player_list[j]
-                
-                # Check if players are colliding at all
-                if not player1.is_colliding(player2, require_complete_overlap=False):
-                    continue
-                    
-                # Determine which player is larger
-                if player1.radius > player2.radius:
-                    larger, smaller = player1, player2
-                elif player2.radius > player1.radius:
-                    larger, smaller = player2, player1
-                else:
-                    continue  # Same size, no eating
-                
-                # Calculate size ratio
-                size_ratio = larger.radius / smaller.radius
-                
-                # Only allow eating if the size difference is above the threshold
-                # and the smaller player is completely inside the larger one
-                if (size_ratio > game_cfg['player_eating_threshold'] and 
-                    smaller.is_colliding(larger)):
-                    # Larger player eats the smaller one
-                    larger.increase_score(smaller.score)
-                    smaller.score = 0
-                    smaller.birth_time = time.time()  # Reset birth time on respawn
-                    smaller.x, smaller.y = self.get_start_location(players)
-                    print(f"[GAME] {larger.name} (size: {larger.radius:.1f}) ATE {smaller.name} (size: {smaller.radius:.1f})")
+        for i, j in zip(pair_i.tolist(), pair_j.tolist()):
+            player1, player2 = player_list[i], player_list[j]
+            
+            # Determine which player is larger
+            if player1.radius > player2.radius:
+                larger, smaller = player1, player2
+            elif player2.radius > player1.radius:
+                larger, smaller = player2, player1
+            else:
+                continue  # Same size, no eating
+            
+            # Only allow eating if the size difference is above the threshold
+            # and the smaller player is completely inside the larger one:
+            # distance + smaller.radius <= larger.radius. Positions are re-read here,
+            # since a player eaten earlier in this pass has respawned elsewhere.
+            if larger.radius <= smaller.radius * eating_threshold:
+                continue
+            dx = larger.x - smaller.x
+            dy = larger.y - smaller.y
+            gap = larger.radius - smaller.radius
+            if dx*dx + dy*dy > gap*gap:
+                continue
+
+            # Larger player eats the smaller one
+            larger.increase_score(smaller.score)
+            smaller.score = 0
+            smaller.reset_age(self.tick_time)  # Restart growth on respawn
+            smaller.x, smaller.y = self.get_start_location(players)
+            smaller.mark_dirty()
+            logger.info("[GAME] %s (size: %.1f) ATE %s (size: %.1f)",
+                        larger.name, larger.radius, smaller.name, smaller.radius)
 
     def use_skill(self, player_id, skill_name):
         """Handle player skill usage."""
-        print(f"[SKILL] Player {player_id} used {skill_name}")
+        logger.info("[SKILL] Player %s used %s", player_id, skill_name)
         if skill_name == "push":
             player = self.players.get(player_id)
             if player:
                 player.push_skill_active = True
-                player.push_skill_end_time = time.time() + skills_cfg['push_skill']['duration']
+                player.push_skill_end_time = self.tick_time + skills_cfg['push_skill']['duration']
+                player.mark_dirty()
+                self._active_skill_players.add(player_id)
         elif skill_name == "pull":
             player = self.players.get(player_id)
             if player:
                 player.pull_skill_active = True
-                player.pull_skill_end_time = time.time() + skills_cfg['pull_skill']['duration']
+                player.pull_skill_end_time = self.tick_time + skills_cfg['pull_skill']['duration']
+                player.mark_dirty()
+                self._active_skill_players.add(player_id)
 
     def update_skills(self):
         """Update active skills with optimized collision detection"""
-        current_time = time.time()
+        if not self._active_skill_players:
+            return
+        current_time = self.tick_time
+        # Skill settings are fixed for the whole pass, so read them once
+        push_cfg = skills_cfg['push_skill']
+        pull_cfg = skills_cfg['pull_skill']
+        push_min_distance = push_cfg.get('min_distance', 1)
+        push_min_force_mul = push_cfg['min_push_force_multiplier']
+        push_force_scale = push_cfg.get('force_scale', 1.0)
+        push_size_threshold = push_cfg['size_threshold_multiplier']
+        pull_force_scale = pull_cfg.get('force_scale', 1.0)
+        pull_size_threshold = pull_cfg['size_threshold_multiplier']
         
         with self.lock:
-            for player_id, player in list(self.players.items()):
-                # Update player's age and size
-                player.update(current_time)
+            # Ball arrays for this pass; skills move balls but never add or remove them
+            n = len(self.balls)
+            bx, by, br = self.balls_x[:n], self.balls_y[:n], self.balls_r[:n]
+            # Balls displaced by skills this pass; written back to the Food objects once at the end
+            moved = self._moved_scratch[:n]
+            moved[:] = False
+            padding = self._padding
+            world_w, world_h = self._world_w, self._world_h
+            # One snapshot per pass, shared by every inner loop
+            player_snapshot = tuple(self.players.values())
+
+            for player_id in list(self._active_skill_players):
+                player = self.players.get(player_id)
+                if player is None:
+                    # Disconnected while a skill was running
+                    self._active_skill_players.discard(player_id)
+                    continue
 
                 # Update push skill
-                if hasattr(player, 'push_skill_active') and player.push_skill_active:
+                if player.push_skill_active:
                     if current_time > player.push_skill_end_time:
                         player.push_skill_active = False
+                        player.mark_dirty()
                     else:
                         push_skill = player.skills.get('push')
                         if push_skill:
@@ -121,65 +298,67 @@ class GameManager:
                             effective_push_radius = push_skill.get_effective_radius(player.radius)
                             # Store for client rendering
                             player.push_radius = effective_push_radius
+                            player.mark_dirty()
                             push_force = push_skill.push_force
+                            min_push_force = push_force * push_min_force_mul
+                            inv_push_radius = 1.0 / effective_push_radius
+                            size_limit = player.radius * push_size_threshold
+                            # The pusher's radius is fixed for the pass, so are its world bounds
+                            own_margin = padding + player.radius
+                            own_max_x = world_w - own_margin
+                            own_max_y = world_h - own_margin
+                            # Bind the pusher's position once; it is only refreshed when the pusher itself moves
+                            px, py = player.x, player.y
                             
-                            for other_id, other_player in list(self.players.items()):
-                                if player_id == other_id:
+                            for other_player in player_snapshot:
+                                if other_player is player:
                                     continue
-                                if self._is_in_skill_range(player, other_player, effective_push_radius):
-                                    dx = other_player.x - player.x
-                                    dy = other_player.y - player.y
-                                    distance = max(skills_cfg['push_skill'].get('min_distance', 1), math.sqrt(dx*dx + dy*dy))
-                                    other_player_size = other_player.radius
-                                    player_size = player.radius
-                                    size_threshold = skills_cfg['push_skill']['size_threshold_multiplier']
-
-                                    if other_player_size > player_size * size_threshold:
-                                        # Object is too big, push player away
-                                        min_push_force = push_skill.push_force * skills_cfg['push_skill']['min_push_force_multiplier']
-                                        force_scale = skills_cfg['push_skill'].get('force_scale', 1.0)
-                                        scale = max(min_push_force, push_force * (1 - (distance / effective_push_radius))) * force_scale
-                                        player.x -= dx * scale / distance
-                                        player.y -= dy * scale / distance
-                                        self._enforce_world_boundaries(player)
-                                    else:
-                                        # Push object away
-                                        min_push_force = push_skill.push_force * skills_cfg['push_skill']['min_push_force_multiplier']
-                                        force_scale = skills_cfg['push_skill'].get('force_scale', 1.0)
-                                        scale = max(min_push_force, push_force * (1 - (distance / effective_push_radius))) * force_scale
-                                        other_player.x += dx * scale / distance
-                                        other_player.y += dy * scale / distance
-                                        self._enforce_world_boundaries(other_player)
-                            
-                            for ball in self.balls:
-                                if self._is_in_skill_range(player, ball, effective_push_radius):
-                                    size_threshold = skills_cfg['push_skill']['size_threshold_multiplier']
-
-                                    dx = ball.x - player.x
-                                    dy = ball.y - player.y
-                                    distance = max(1, math.sqrt(dx*dx + dy*dy))
+                                dx = other_player.x - px
+                                dy = other_player.y - py
+                                reach = effective_push_radius + other_player.radius
+                                # Cheap bounding-box reject before the squared distance
+                                if not (-reach <= dx <= reach and -reach <= dy <= reach):
+                                    continue
+                                d2 = dx*dx + dy*dy
+                                if d2 <= reach*reach:
+                                    distance = max(push_min_distance, math.sqrt(d2))
+                                    step = max(min_push_force, push_force * (1 - distance * inv_push_radius)) * push_force_scale / distance
 
-                                    if ball.radius > player.radius * size_threshold:
+                                    if other_player.radius > size_limit:
                                         # Object is too big, push player away
-                                        min_push_force = push_skill.push_force * skills_cfg['push_skill']['min_push_force_multiplier']
-                                        force_scale = skills_cfg['push_skill'].get('force_scale', 1.0)
-                                        scale = max(min_push_force, push_force * (1 - (distance / effective_push_radius))) * force_scale
-                                        player.x -= dx * scale / distance
-                                        player.y -= dy * scale / distance
-                                        self._enforce_world_boundaries(player)
+                                        nx = px - dx * step
+                                        ny = py - dy * step
+                                        px = own_margin if nx < own_margin else (own_max_x if nx > own_max_x else nx)
+                                        py = own_margin if ny < own_margin else (own_max_y if ny > own_max_y else ny)
+                                        player.x, player.y = px, py
                                     else:
-                                        # Push object away
-                                        min_push_force = push_skill.push_force * skills_cfg['push_skill']['min_push_force_multiplier']
-                                        force_scale = skills_cfg['push_skill'].get('force_scale', 1.0)
-                                        scale = max(min_push_force, push_force * (1 - (distance / effective_push_radius))) * force_scale
-                                        ball.x += dx * scale / distance
-                                        ball.y += dy * scale / distance
-                                        self._enforce_world_boundaries(ball)
+                                        # Push object away, clamped to the world as it moves
+                                        margin = padding + other_player.radius
+                                        max_x = world_w - margin
+                                        max_y = world_h - margin
+                                        nx = other_player.x + dx * step
+                                        ny = other_player.y + dy * step
+                                        other_player.x = margin if nx < margin else (max_x if nx > max_x else nx)
+                                        other_player.y = margin if ny < margin else (max_y if ny > max_y else ny)
+                                        other_player.mark_dirty()
+                            
+                            # Balls are pushed from the pusher's position at this point
+                            recoil_x, recoil_y = apply_push(
+                                px, py, bx, by, br, moved, effective_push_radius, push_force,
+                                min_push_force, push_force_scale, size_limit,
+                                padding, world_w, world_h)
+                            if recoil_x or recoil_y:
+                                # Balls that are too big push the player away
+                                nx = px - recoil_x
+                                ny = py - recoil_y
+                                player.x = own_margin if nx < own_margin else (own_max_x if nx > own_max_x else nx)
+                                player.y = own_margin if ny < own_margin else (own_max_y if ny > own_max_y else ny)
                 
                 # Update pull skill
-                if hasattr(player, 'pull_skill_active') and player.pull_skill_active:
+                if player.pull_skill_active:
                     if current_time > player.pull_skill_end_time:
                         player.pull_skill_active = False
+                        player.mark_dirty()
                     else:
                         pull_skill = player.skills.get('pull')
                         if pull_skill:
@@ -187,92 +366,107 @@ class GameManager:
                             effective_pull_radius = pull_skill.get_effective_radius(player.radius)
                             # Store for client rendering
                             player.pull_radius = effective_pull_radius
+                            player.mark_dirty()
                             pull_force = pull_skill.pull_force
+                            inv_pull_radius = 1.0 / effective_pull_radius
+                            size_limit = player.radius * pull_size_threshold
+                            # Pulling never moves the puller, so its position is fixed for this pass
+                            px, py = player.x, player.y
                             
-                            for other_id, other_player in list(self.players.items()):
-                                if player_id == other_id:
+                            for other_player in player_snapshot:
+                                if other_player is player:
+                                    continue
+                                dx = other_player.x - px
+                                dy = other_player.y - py
+                                reach = effective_pull_radius + other_player.radius
+                                # Cheap bounding-box reject before the squared distance
+                                if not (-reach <= dx <= reach and -reach <= dy <= reach):
                                     continue
-                                if self._is_in_skill_range(player, other_player, effective_pull_radius):
-                                    size_threshold = skills_cfg['pull_skill']['size_threshold_multiplier']
-
-                                    if not (other_player.radius > player.radius * size_threshold):
-                                        # Only pull if not too big
-                                        dx = other_player.x - player.x
-                                        dy = other_player.y - player.y
-                                        distance = max(1, math.sqrt(dx*dx + dy*dy))
-                                        force_scale = skills_cfg['pull_skill'].get('force_scale', 1.0)
-                                        scale = pull_force * (1 - (distance / effective_pull_radius)) * force_scale
-                                        other_player.x -= dx * scale / distance  # Invert direction for pull
-                                        other_player.y -= dy * scale / distance  # Invert direction for pull
-                                        self._enforce_world_boundaries(other_player)
+                                d2 = dx*dx + dy*dy
+                                # Only pull if not too big
+                                if d2 <= reach*reach and not (other_player.radius > size_limit):
+                                    distance = max(1, math.sqrt(d2))
+                                    step = pull_force * (1 - distance * inv_pull_radius) * pull_force_scale / distance
+                                    # Invert direction for pull, clamped to the world as it moves
+                                    margin = padding + other_player.radius
+                                    max_x = world_w - margin
+                                    max_y = world_h - margin
+                                    nx = other_player.x - dx * step
+                                    ny = other_player.y - dy * step
+                                    other_player.x = margin if nx < margin else (max_x if nx > max_x else nx)
+                                    other_player.y = margin if ny < margin else (max_y if ny > max_y else ny)
+                                    other_player.mark_dirty()
                             
-                            for ball in self.balls:
-                                if self._is_in_skill_range(player, ball, effective_pull_radius):
-                                    size_threshold = skills_cfg['pull_skill']['size_threshold_multiplier']
-
-                                    dx = ball.x - player.x
-                                    dy = ball.y - player.y
-                                    distance = max(1, math.sqrt(dx*dx + dy*dy))
-
-                                    if not (ball.radius > player.radius * size_threshold):
-                                        # Only pull if not too big
-                                        force_scale = skills_cfg['pull_skill'].get('force_scale', 1.0)
-                                        scale = pull_force * (1 - (distance / effective_pull_radius)) * force_scale
-                                        ball.x -= dx * scale / distance  # Invert direction for pull
-                                        ball.y -= dy * scale / distance  # Invert direction for pull
-                                        self._enforce_world_boundaries(ball)
-    
-    def _is_in_skill_range(self, obj1, obj2, skill_radius):
-        """Check if obj2 is within skill_radius of obj1.
-        
-        Args:
-            obj1: The source object (player using the skill)
-            obj2: The target object to check
-            skill_radius: The total radius of the skill effect (including player radius)
-            
-        Returns:
-            bool: True if obj2 is within the skill's effective range
-        """
-        dx = obj1.x - obj2.x
-        dy = obj1.y - obj2.y
-        distance_sq = dx*dx + dy*dy
-        
-        # Check if the distance between centers is less than the sum of skill radius and target radius
-        return distance_sq <= (skill_radius + obj2.radius) ** 2
+                            apply_pull(
+                                px, py, bx, by, br, moved, effective_pull_radius, pull_force,
+                                pull_force_scale, size_limit,
+                                padding, world_w, world_h)
 
-    def _enforce_world_boundaries(self, game_object):
-        """Ensure a game object stays within the world boundaries"""
-        padding = world_cfg['boundary']['padding']
-        world_w, world_h = self.world_dimensions
-        game_object.x = max(padding + game_object.radius, min(game_object.x, world_w - padding - game_object.radius))
-        game_object.y = max(padding + game_object.radius, min(game_object.y, world_h - padding - game_object.radius))
+                if not (player.push_skill_active or player.pull_skill_active):
+                    self._active_skill_players.discard(player_id)
+
+            self._write_back_moved_balls(np.flatnonzero(moved))
+    
+    def _write_back_moved_balls(self, idx):
+        """Copy the array positions of the given balls back to their Food objects"""
+        balls = self.balls
+        for i, x, y in zip(idx.tolist(), self.balls_x[idx].tolist(), self.balls_y[idx].tolist()):
+            ball = balls[i]
+            ball.x = x
+            ball.y = y
 
     def create_balls(self, n):
         """creates orbs/balls in the game world"""
-        world_w, world_h = self.world_dimensions
-        padding = world_cfg['boundary']['padding']
-        for _ in range(n):
-            x = random.randint(padding, world_w - padding)
-            y = random.randint(padding, world_h - padding)
-            self.balls.append(Food(x, y, random.choice(self.player_colors)))
+        self._spawn_balls(n)
 
     def get_start_location(self, players):
         """picks a start location for a player"""
         world_w, world_h = self.world_dimensions
-        padding = world_cfg['boundary']['padding']
+        padding = self._padding
         
-        for _ in range(world_cfg['start_location_attempts']):
-            x = random.randint(padding, world_w - padding)
-            y = random.randint(padding, world_h - padding)
-            valid_position = True
-            for player in players.values():
-                dis = math.sqrt((x - player.x)**2 + (y - player.y)**2)
-                if dis <= self.player_start_radius + player.radius + padding:
-                    valid_position = False
-                    break
-            if valid_position:
-                return (x, y)
-        return (random.randint(padding, world_w - padding), random.randint(padding, world_h - padding))
+        # Mark every grid cell that touches a player's exclusion square, then pick
+        # a free cell; any point inside it is clear of every player
+        cell = self.spawn_cell_size
+        cols = (world_w - 2 * padding) // cell + 1
+        rows = (world_h - 2 * padding) // cell + 1
+        occupied = np.zeros((cols, rows), dtype=bool)
+        for player in players.values():
+            clearance = self.player_start_radius + player.radius + padding
+            x0 = max(0, int((player.x - clearance - padding) // cell))
+            x1 = max(0, int((player.x + clearance - padding) // cell) + 1)
+            y0 = max(0, int((player.y - clearance - padding) // cell))
+            y1 = max(0, int((player.y + clearance - padding) // cell) + 1)
+            occupied[x0:x1, y0:y1] = True
+        
+        rng = self._rng
+        free = np.flatnonzero(~occupied)
+        if not free.size:
+            return self._sample_start_location(players)
+        cx, cy = divmod(int(free[rng.integers(free.size)]), rows)
+        x = int(rng.integers(padding + cx * cell, min(padding + (cx + 1) * cell - 1, world_w - padding), endpoint=True))
+        y = int(rng.integers(padding + cy * cell, min(padding + (cy + 1) * cell - 1, world_h - padding), endpoint=True))
+        return (x, y)
+
+    def _sample_start_location(self, players):
+        """Random start location checked against each player's exact clearance.
+
+        The square grid cells overestimate the space around round players, so
+        crowded worlds can still have room when no cell is free.
+        """
+        world_w, world_h = self.world_dimensions
+        padding = self._padding
+        attempts = world_cfg['start_location_attempts']
+        xs = self._rng.integers(padding, world_w - padding, attempts, endpoint=True)
+        ys = self._rng.integers(padding, world_h - padding, attempts, endpoint=True)
+        valid = np.ones(attempts, dtype=bool)
+        for player in players.values():
+            clearance = self.player_start_radius + player.radius + padding
+            dx = xs - player.x
+            dy = ys - player.y
+            valid &= dx*dx + dy*dy > clearance*clearance
+        # First valid candidate, or the last one unchecked if none is clear
+        i = int(valid.argmax()) if valid.any() else attempts - 1
+        return (int(xs[i]), int(ys[i]))
 
     def get_serializable_players(self):
         """Convert Player objects to a serializable dictionary"""
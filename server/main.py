@@ -1,5 +1,7 @@
 import threading
 import logging
+import logging.handlers
+import queue
 from typing import Dict, List
 from shared.utils.config_loader import world_cfg, player_cfg
 
@@ -8,8 +10,15 @@ from shared.entities.food import Food
 from server.game_manager import GameManager
 from server.network_manager import NetworkManager
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s')
+# Configure logging. Records are queued by the calling thread and written out
+# by a listener thread, so console I/O never blocks the game loop.
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 logger = logging.getLogger(__name__)
 
 
@@ -42,5 +51,9 @@ if __name__ == "__main__":
         lock=lock
     )
 
-    if network_manager.connect_server():
-        network_manager.mainloop()
+    log_listener.start()
+    try:
+        if network_manager.connect_server():
+            network_manager.mainloop()
+    finally:
+        log_listener.stop()
@@ -7,7 +7,9 @@ import math
 import weakref
 import logging
 import select
-from typing import Dict, List, Set, Tuple, Optional
+import selectors
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Set, Tuple, Optional
 from dataclasses import asdict
 from shared.utils.config_loader import server_cfg, network_cfg, world_cfg, player_cfg, game_cfg, food_cfg, skills_cfg
 
@@ -16,6 +18,7 @@ from shared.entities.food import Food
 from server.client_handler import ClientThread
 from server.game_manager import GameManager
 from shared.packets import ServerFullPacket
+from shared.utils.compression import encode_payload
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,8 @@ class NetworkManager:
 
         self.SOCKET = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.SOCKET.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Wakes the connection thread only when a client is waiting to be accepted
+        self.selector = selectors.DefaultSelector()
         
         self.server_ip = network_cfg['host']
         self.port = network_cfg['port']
@@ -35,6 +40,9 @@ class NetworkManager:
         self.running = False
         
         self.client_threads: Dict[int, ClientThread] = {}
+        # Shared by every ClientThread so they don't keep the server alive
+        self._self_ref = weakref.ref(self)
+        self.player_names: Set[str] = set()
         self.connections = 0
         self._id = 0
         
@@ -42,14 +50,18 @@ class NetworkManager:
         self.start = False
         self.start_time = 0
         
-        self.connection_attempts = {}
+        # Recent connection timestamps per IP, oldest first
+        self.connection_attempts: Dict[str, Deque[float]] = defaultdict(deque)
+        self._next_attempts_sweep = 0.0
 
     def connect_server(self):
         """Initialize and start the server socket."""
         try:
             self.SOCKET.bind((self.server_ip, self.port))
-            self.SOCKET.settimeout(1.0)  # Add timeout for accept()
+            self._configure_listen_socket()
+            self.SOCKET.setblocking(False)  # accept() only runs once the selector reports a client
             self.SOCKET.listen(self.max_connections)
+            self.selector.register(self.SOCKET, selectors.EVENT_READ)
             self.running = True
             
             # Log all available IP addresses
@@ -81,6 +93,29 @@ class NetworkManager:
             logger.error(f"Available IPs: {socket.gethostbyname_ex(socket.gethostname())[2]}")
             return False
 
+    def _configure_listen_socket(self):
+        """Apply buffer sizes to the listening socket before listen().
+
+        Accepted sockets inherit them, and the TCP window scale is negotiated
+        during the handshake from the listener's receive buffer, so setting
+        them after accept() would be too late.
+        """
+        socket_cfg = network_cfg['socket']
+        try:
+            self.SOCKET.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, socket_cfg['rcvbuf'])
+            self.SOCKET.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, socket_cfg['sndbuf'])
+        except OSError as e:
+            logger.warning(f"Could not apply socket buffer sizes: {e}")
+
+    def _configure_client_socket(self, conn):
+        """Apply TCP_NODELAY to an accepted client socket."""
+        if not network_cfg['socket']['tcp_nodelay']:
+            return
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.warning(f"Could not apply socket options: {e}")
+
     def mainloop(self):
         """Main game loop with proper cleanup."""
         logger.info("Setting up level")
@@ -91,39 +126,26 @@ class NetworkManager:
             conn_thread = threading.Thread(target=self.connection_thread, daemon=True)
             conn_thread.start()
             
-            last_time = time.time()
             tick_rate = 1.0 / game_cfg['tick_rate']
+            next_tick = time.monotonic() + tick_rate
             
             while self.running:
                 try:
-                    current_time = time.time()
-                    delta_time = current_time - last_time
-                    last_time = current_time
+                    # One clock reading per tick, shared by every game subsystem
+                    current_time = time.monotonic()
                     
                     # Process game updates
                     if self.start:
-                        with self.lock:
-                            # Update all players (age and size)
-                            for player in self.players.values():
-                                player.update(delta_time)
-                                
-                            self.game_manager.update_skills()
-                            self.game_manager.check_collision(self.players, self.balls)
-                            self.game_manager.player_collision(self.players)
-                            
-                            # Maintain ball count
-                            min_balls = server_cfg['ball_count']['min']
-                            max_balls = server_cfg['ball_count']['max']
-                            if len(self.balls) < min_balls:
-                                to_add = min(max_balls - len(self.balls), max_balls - min_balls + 1)
-                                if to_add > 0:
-                                    self.game_manager.create_balls(to_add)
+                        self.game_manager.tick(current_time)
                     
-                    # Calculate sleep time to maintain consistent tick rate
-                    elapsed = time.time() - current_time
-                    sleep_time = max(0, tick_rate - elapsed)
+                    # Sleep until an absolute deadline so sleep overshoot doesn't accumulate as drift
+                    sleep_time = next_tick - time.monotonic()
                     if sleep_time > 0:
                         time.sleep(sleep_time)
+                        next_tick += tick_rate
+                    else:
+                        # Running behind: restart the schedule rather than bursting ticks to catch up
+                        next_tick = time.monotonic() + tick_rate
                         
                 except KeyboardInterrupt:
                     logger.info("Shutting down server...")
@@ -152,6 +174,7 @@ class NetworkManager:
         
         # Close server socket
         try:
+            self.selector.close()
             self.SOCKET.close()
         except:
             pass
@@ -162,52 +185,67 @@ class NetworkManager:
         """Handle new client connections with rate limiting."""
         while self.running:
             try:
+                # The timeout only bounds how long shutdown takes to be noticed
+                if not self.selector.select(timeout=1.0):
+                    continue
                 try:
                     conn, addr = self.SOCKET.accept()
-                except socket.timeout:
+                except BlockingIOError:
+                    # Another wakeup raced us to the pending connection
                     continue
                 except OSError as e:
                     if not self.running:
                         break
                     raise
                 
+                # Windows and BSD/macOS hand out accepted sockets with the
+                # listener's non-blocking flag, so reset it explicitly
+                conn.setblocking(True)
+                self._configure_client_socket(conn)
                 client_ip = addr[0]
-                current_time = time.time()
+                current_time = time.monotonic()
+                cutoff = current_time - 60
                 
                 # Rate limiting
                 with self.lock:
-                    # Clean up old connection attempts
-                    for ip, timestamps in list(self.connection_attempts.items()):
-                        valid_timestamps = [ts for ts in timestamps if current_time - ts < 60]
-                        if valid_timestamps:
-                            self.connection_attempts[ip] = valid_timestamps
-                        else:
+                    # Forget IPs with no attempt inside the window, at most once per window
+                    if current_time >= self._next_attempts_sweep:
+                        stale = [ip for ip, timestamps in self.connection_attempts.items()
+                                 if not timestamps or timestamps[-1] <= cutoff]
+                        for ip in stale:
                             del self.connection_attempts[ip]
+                        self._next_attempts_sweep = current_time + 60
+                    
+                    # Expire this IP's old attempts; only its own history is touched
+                    attempts = self.connection_attempts[client_ip]
+                    while attempts and attempts[0] <= cutoff:
+                        attempts.popleft()
                     
                     # Check connection rate limit (e.g., 5 connections per minute per IP)
-                    if len(self.connection_attempts.get(client_ip, [])) >= 5:
+                    if len(attempts) >= 5:
                         logger.warning(f"Connection rate limit exceeded for {client_ip}")
                         conn.close()
                         continue
                     
                     # Record connection attempt
-                    if client_ip not in self.connection_attempts:
-                        self.connection_attempts[client_ip] = []
-                    self.connection_attempts[client_ip].append(current_time)
+                    attempts.append(current_time)
                     
                     # Check max connections
                     if self.connections >= self.max_connections:
                         logger.warning(f"Max connections ({self.max_connections}) reached")
                         server_full_packet = ServerFullPacket(message=network_cfg['protocol']['server_full_message'])
                         # Need to send length prefix manually as this is outside ClientThread
-                        response_bytes = server_full_packet.to_json().encode('utf-8')
+                        response_bytes = encode_payload(server_full_packet.to_bytes())
                         conn.sendall(len(response_bytes).to_bytes(4, 'big') + response_bytes)
                         conn.close()
                         continue
                     
                     if not self.start:
                         self.start = True
-                        self.start_time = current_time
+                        # Same clock as GameManager.tick_time, which game_time is measured against
+                        self.start_time = time.monotonic()
+                        self.game_manager.start = True
+                        self.game_manager.start_time = self.start_time
                         logger.info("Game Started")
                     
                     # Create client thread
@@ -217,7 +255,7 @@ class NetworkManager:
                     
                     # Create and start client thread
                     client_thread = ClientThread(
-                        weakref.ref(self),
+                        self._self_ref,
                         conn,
                         current_id
                     )
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import math
 from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class GameObject:
     """Base class for all game objects with position and collision detection."""
     x: float
@@ -14,18 +14,27 @@ class GameObject:
 
     def is_colliding(self, other: 'GameObject') -> bool:
         """Check if this object is colliding with another game object."""
-        distance = math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        dx = self.x - other.x
+        dy = self.y - other.y
         
-        # Use radius only for collision detection
-        return distance <= self.radius + other.radius
+        # Use radius only for collision detection; squared distances avoid the sqrt
+        reach = self.radius + other.radius
+        return dx*dx + dy*dy <= reach*reach
 
     def distance_to(self, other: 'GameObject') -> float:
         """Calculate distance to another game object."""
-        return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def to_dict(self):
         """Return a dictionary representation of the GameObject object."""
-        return asdict(self)
+        # Built by hand: asdict() reflects over fields() and deep-copies on every call
+        return {
+            "x": self.x,
+            "y": self.y,
+            "radius": self.radius,
+            "color": self.color,
+            "object_type": self.object_type,
+        }
     
     def __str__(self):
         """Returns a formatted string describing the GameObject object's core attributes."""
@@ -1,19 +1,38 @@
 import random
 import time
-import math
 
 from shared.entities.survival import SurvivalStats, SurvivalSystem
 from shared.entities.skills.push import PushSkill
 from shared.entities.skills.pull import PullSkill
 from shared.utils.config_loader import player_cfg
 
+# Growth settings read once at import; update() runs for every player every tick
+_NEWBORN = player_cfg['size']['newborn']
+_ADULT = player_cfg['size']['adult']
+_SIZE_DELTA = _ADULT - _NEWBORN
+_INV_GROWTH = 1.0 / player_cfg['size']['growth_duration']
+_START_VELOCITY = player_cfg['start_velocity']
+_COLORS = tuple(player_cfg['colors'])
+# Dedicated generator for player attributes; can be seeded for reproducible runs
+_RNG = random.Random()
+
 
 class Player:
+    __slots__ = (
+        'id', 'name', 'start_velocity', 'color', 'x', 'y',
+        'is_moving', 'is_sprinting', 'is_crafting', 'score',
+        'stats', '_survival', 'skills',
+        'push_skill_active', 'push_skill_end_time', 'push_radius',
+        'pull_skill_active', 'pull_skill_end_time', 'pull_radius',
+        'birth_time', 'age', 'radius', '_grown',
+        '_dirty', '_dict_cache',
+    )
+
     def __init__(self, player_id, name, x=0, y=0):
         self.id = player_id
         self.name = name
-        self.start_velocity = player_cfg['start_velocity']
-        self.color = random.choice(player_cfg['colors'])
+        self.start_velocity = _START_VELOCITY
+        self.color = _RNG.choice(_COLORS)
         self.x = x
         self.y = y
         self.is_moving = False
@@ -28,13 +47,35 @@ class Player:
         }
         self.push_skill_active = False
         self.push_skill_end_time = 0
+        self.push_radius = 0
         self.pull_skill_active = False
         self.pull_skill_end_time = 0
+        self.pull_radius = 0
         
         # Age and growth tracking
-        self.birth_time = time.time()
+        self.birth_time = time.monotonic()
         self.age = 0  # in seconds
-        self.radius = player_cfg['size']['newborn']  # Start at newborn size
+        self.radius = _NEWBORN  # Start at newborn size
+        self._grown = False  # Set once the radius has reached adult size
+
+        # Cached to_dict() result. The key layout is fixed, so after a state change
+        # to_dict() refreshes the values in place instead of building a new dict.
+        self._dirty = True
+        self._dict_cache = {
+            "id": self.id,
+            "name": self.name,
+            "x": 0,
+            "y": 0,
+            "radius": 0,
+            "score": 0,
+            "color": self.color,
+            "age": 0,
+            "growth_percentage": 0,
+            "push_skill_active": False,
+            "push_radius": 0,
+            "pull_skill_active": False,
+            "pull_radius": 0,
+        }
 
     def __str__(self):
         return f"Player(id={self.id}, name='{self.name}', score={self.score}, x={self.x}, y={self.y})"
@@ -42,53 +83,97 @@ class Player:
     def __repr__(self):
         return str(self)
 
+    def mark_dirty(self):
+        """Invalidate the cached to_dict() result after changing state from outside the class."""
+        self._dirty = True
+
     def to_dict(self):
+        if not self._dirty:
+            return self._dict_cache
+
+        # The game loop encodes each snapshot before the next tick, so the
+        # returned dict can be updated in place
+        state = self._dict_cache
+        state["x"] = self.x
+        state["y"] = self.y
+        state["radius"] = self.radius
+        state["score"] = self.score
+        state["age"] = self.age
         # Calculate growth percentage (0-100)
-        growth_pct = min(100.0, (self.age / player_cfg['size']['growth_duration']) * 100)
-        
-        return {
-            "id": self.id,
-            "name": self.name,
-            "x": self.x,
-            "y": self.y,
-            "radius": self.radius,
-            "score": self.score,
-            "color": self.color,
-            "age": self.age,
-            "growth_percentage": growth_pct,
-            "push_skill_active": self.push_skill_active,
-            "push_radius": getattr(self, 'push_radius', 0),
-            "pull_skill_active": self.pull_skill_active,
-            "pull_radius": getattr(self, 'pull_radius', 0),
-        }
+        state["growth_percentage"] = min(100.0, self.age * _INV_GROWTH * 100)
+        state["push_skill_active"] = self.push_skill_active
+        state["push_radius"] = self.push_radius
+        state["pull_skill_active"] = self.pull_skill_active
+        state["pull_radius"] = self.pull_radius
+        self._dirty = False
+        return state
 
-    def update(self, dt):
+    def update(self, now):
         """Update player state, including age and size.
         
         The player's radius is determined purely by their age, growing from 'newborn' size
         to 'adult' size over the configured growth duration.
+
+        Args:
+            now: time.monotonic() reading for the current tick
         """
         # Update age
-        self.age = time.time() - self.birth_time
+        age = now - self.birth_time
+        # Clients only display whole seconds, so a fractional change alone doesn't invalidate to_dict()
+        if int(age) != int(self.age):
+            self._dirty = True
+        self.age = age
+
+        # Adults keep a constant radius until reset_age()
+        if self._grown:
+            return
         
         # Calculate size based purely on age
         # Linear interpolation between newborn and adult size based on age
-        growth_progress = min(self.age / player_cfg['size']['growth_duration'], 1.0)  # Clamp at 1.0 (100%)
-        self.radius = player_cfg['size']['newborn'] + \
-                     (player_cfg['size']['adult'] - player_cfg['size']['newborn']) * growth_progress
+        growth_progress = age * _INV_GROWTH
+        if growth_progress >= 1.0:
+            self._grown = True
+            radius = _ADULT
+        else:
+            radius = _NEWBORN + _SIZE_DELTA * growth_progress
+        if radius != self.radius:
+            self.radius = radius
+            self._dirty = True
+
+    def reset_age(self, now):
+        """Restart growth from newborn, e.g. on respawn.
+
+        Args:
+            now: time.monotonic() reading for the current tick
+        """
+        self.birth_time = now
+        self._grown = False
+        self._dirty = True
 
     def move(self, dx, dy, world_w, world_h, padding):
         """Move the player and enforce world boundaries."""
-        new_x = self.x + dx * self.start_velocity
-        new_y = self.y + dy * self.start_velocity
+        velocity = self.start_velocity
+        new_x = self.x + dx * velocity
+        new_y = self.y + dy * velocity
         
         # Enforce world boundaries using current radius
-        self.x = max(padding + self.radius, min(new_x, world_w - padding - self.radius))
-        self.y = max(padding + self.radius, min(new_y, world_h - padding - self.radius))
+        lo = padding + self.radius
+        if new_x < lo:
+            new_x = lo
+        elif new_x > world_w - lo:
+            new_x = world_w - lo
+        if new_y < lo:
+            new_y = lo
+        elif new_y > world_h - lo:
+            new_y = world_h - lo
+        self.x = new_x
+        self.y = new_y
+        self._dirty = True
 
     def increase_score(self, amount):
         """Increase the player's score."""
         self.score += amount
+        self._dirty = True
 
     def is_colliding(self, other, require_complete_overlap=True):
         """Check for collision with another object.
@@ -99,13 +184,16 @@ class Player:
         """
         dx = self.x - other.x
         dy = self.y - other.y
-        distance = math.sqrt(dx**2 + dy**2)
+        # Compare squared distances so no sqrt is needed
+        distance_sq = dx*dx + dy*dy
         
         if require_complete_overlap:
             # For complete overlap, the distance between centers plus the smaller radius
             # must be less than the larger radius
             if self.radius > other.radius:
-                return distance + other.radius <= self.radius
+                gap = self.radius - other.radius
             else:
-                return distance + self.radius <= other.radius
-        return distance < self.radius + other.radius
\ No newline at end of file
+                gap = other.radius - self.radius
+            return distance_sq <= gap*gap
+        reach = self.radius + other.radius
+        return distance_sq < reach*reach
\ No newline at end of file
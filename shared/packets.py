@@ -1,101 +1,110 @@
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List, Tuple, Type, TypeVar, ClassVar # Added ClassVar
 
+try:
+    import orjson  # Optional C-accelerated JSON; output stays plain JSON either way
+except ImportError:
+    orjson = None
+
 T = TypeVar('T', bound='Packet')
 
-@dataclass
+@dataclass(slots=True)
 class Packet:
     type: ClassVar[str] # Changed to ClassVar
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
+        # Field values are already JSON-ready (game state holds plain dicts and lists),
+        # so a shallow copy replaces asdict(), which deep-copied every ball and player.
+        # Packets are slotted, so each subclass's __slots__ lists exactly its fields.
+        data = {name: getattr(self, name) for name in self.__slots__}
         # Ensure the 'type' field is always present in the dictionary for JSON serialization
-        # as asdict might exclude ClassVar fields.
+        # as it is a ClassVar and not stored on the instance.
         data['type'] = self.type
         return data
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
 
+    def to_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON, using orjson when it is installed."""
+        if orjson is not None:
+            # Game state is keyed by integer player ids, which json.dumps also turns into strings
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return self.to_json().encode('utf-8')
+
     @classmethod
     def from_json(cls: Type[T], json_str: str) -> T:
-        data = json.loads(json_str)
-        packet_type = data.pop('type') # Remove 'type' from data before passing to constructor
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
+        packet_type = data.pop('type', None) # Remove 'type' from data before passing to constructor
         if not packet_type:
             raise ValueError("Packet JSON missing 'type' field")
 
-        # This is a simple factory. For a larger system, a more robust factory pattern
-        # or a registry of packet types would be better.
-        if packet_type == "connect":
-            return ConnectPacket(**data)
-        elif packet_type == "move":
-            return MovePacket(**data)
-        elif packet_type == "skill":
-            return SkillPacket(**data)
-        elif packet_type == "get_game_state":
-            return GetGameStatePacket(**data)
-        elif packet_type == "player_id":
-            return PlayerIdPacket(**data)
-        elif packet_type == "game_state":
-            return GameStatePacket(**data)
-        elif packet_type == "username_taken":
-            return UsernameTakenPacket(**data)
-        elif packet_type == "server_full":
-            return ServerFullPacket(**data)
-        elif packet_type == "ping":
-            return PingPacket(**data)
-        elif packet_type == "pong":
-            return PongPacket(**data)
-        else:
+        packet_cls = _PACKET_TYPES.get(packet_type)
+        if packet_cls is None:
             raise ValueError(f"Unknown packet type: {packet_type}")
+        return packet_cls(**data)
 
-@dataclass
+@dataclass(slots=True)
 class ConnectPacket(Packet):
     name: str
     type: ClassVar[str] = "connect" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class MovePacket(Packet):
     dx: float
     dy: float
     type: ClassVar[str] = "move" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class SkillPacket(Packet):
     skill_name: str
     type: ClassVar[str] = "skill" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class GetGameStatePacket(Packet):
     type: ClassVar[str] = "get_game_state" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class PlayerIdPacket(Packet):
     player_id: str
     type: ClassVar[str] = "player_id" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class GameStatePacket(Packet):
     balls: List[Dict[str, Any]]
     players: Dict[str, Any]
     game_time: float
     type: ClassVar[str] = "game_state" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class UsernameTakenPacket(Packet):
     message: str
     type: ClassVar[str] = "username_taken" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class ServerFullPacket(Packet):
     message: str
     type: ClassVar[str] = "server_full" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class PingPacket(Packet):
     type: ClassVar[str] = "ping" # Changed to ClassVar
 
-@dataclass
+@dataclass(slots=True)
 class PongPacket(Packet):
-    type: ClassVar[str] = "pong" # Changed to ClassVar
\ No newline at end of file
+    type: ClassVar[str] = "pong" # Changed to ClassVar
+
+# Packet classes by their type string, used by Packet.from_json
+_PACKET_TYPES: Dict[str, Type[Packet]] = {cls.type: cls for cls in (
+    ConnectPacket,
+    MovePacket,
+    SkillPacket,
+    GetGameStatePacket,
+    PlayerIdPacket,
+    GameStatePacket,
+    UsernameTakenPacket,
+    ServerFullPacket,
+    PingPacket,
+    PongPacket,
+)}
@@ -0,0 +1,43 @@
+"""Optional compression of server-to-client message payloads."""
+
+import zlib
+
+from shared.utils.config_loader import network_cfg
+
+# First byte of every server-to-client payload
+FLAG_RAW = b'\x00'
+FLAG_ZLIB = b'\x01'
+
+
+def encode_payload(data: bytes) -> bytes:
+    """
+    Prefix a payload with its compression flag, compressing it if it is large.
+
+    Args:
+        data: Serialized message bytes
+
+    Returns:
+        Flag byte followed by the raw or zlib-compressed payload
+    """
+    compression = network_cfg['compression']
+    if compression['enabled'] and len(data) > compression['threshold']:
+        return FLAG_ZLIB + zlib.compress(data, compression['level'])
+    return FLAG_RAW + data
+
+
+def decode_payload(data: bytes) -> bytes:
+    """
+    Strip the compression flag from a payload and decompress it if needed.
+
+    Args:
+        data: Payload produced by encode_payload
+
+    Returns:
+        The original serialized message bytes
+    """
+    flag, body = data[:1], data[1:]
+    if flag == FLAG_ZLIB:
+        return zlib.decompress(body)
+    if flag == FLAG_RAW:
+        return body
+    raise ValueError(f"Unknown payload compression flag: {flag!r}")
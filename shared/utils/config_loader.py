@@ -1,13 +1,24 @@
 """Utility functions for loading configuration files."""
 
+import threading
 import yaml
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+# libyaml's C loader when PyYAML was built with it
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed configs by path, with the file signature they were parsed from
+_cache: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
 
 
 def load_config(config_name: str) -> Dict[str, Any]:
     """
     Load a YAML configuration file from the config directory.
+
+    The parsed file is cached and only re-read once its modification time,
+    size or inode changes.
     
     Args:
         config_name: Name of the config file (without .yaml extension)
@@ -18,8 +29,17 @@ def load_config(config_name: str) -> Dict[str, Any]:
     config_dir = Path(__file__).parent.parent.parent / 'config'
     config_path = config_dir / f"{config_name}.yaml"
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    st = config_path.stat()
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _cache_lock:
+        cached = _cache.get(config_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_Loader)
+        _cache[config_path] = (signature, data)
+        return data
 
 
 # Load common configurations
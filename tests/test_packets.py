@@ -0,0 +1,52 @@
+import unittest
+
+from shared.packets import (
+    _PACKET_TYPES, Packet, ConnectPacket, MovePacket, SkillPacket, GetGameStatePacket,
+    PlayerIdPacket, GameStatePacket, UsernameTakenPacket, ServerFullPacket, PingPacket, PongPacket,
+)
+
+# One instance of every packet class; JSON turns dict keys into strings, so
+# sample game state uses string player ids
+SAMPLES = [
+    ConnectPacket(name="alice"),
+    MovePacket(dx=0.5, dy=-1.0),
+    SkillPacket(skill_name="push"),
+    GetGameStatePacket(),
+    PlayerIdPacket(player_id="1"),
+    GameStatePacket(
+        balls=[{"x": 1, "y": 2, "radius": 5, "color": [255, 0, 0], "object_type": "Food"}],
+        players={"1": {"id": 1, "name": "alice", "x": 10.0, "y": 20.0}},
+        game_time=1.5,
+    ),
+    UsernameTakenPacket(message="taken"),
+    ServerFullPacket(message="full"),
+    PingPacket(),
+    PongPacket(),
+]
+
+
+class PacketRegistryTest(unittest.TestCase):
+    def test_registry_keys_match_class_types(self):
+        for packet_type, cls in _PACKET_TYPES.items():
+            self.assertEqual(packet_type, cls.type)
+
+    def test_samples_cover_every_registered_class(self):
+        self.assertEqual({type(p) for p in SAMPLES}, set(_PACKET_TYPES.values()))
+
+    def test_round_trip_json(self):
+        for packet in SAMPLES:
+            with self.subTest(packet=type(packet).__name__):
+                self.assertEqual(Packet.from_json(packet.to_json()), packet)
+
+    def test_round_trip_bytes(self):
+        for packet in SAMPLES:
+            with self.subTest(packet=type(packet).__name__):
+                self.assertEqual(Packet.from_json(packet.to_bytes().decode('utf-8')), packet)
+
+    def test_unknown_type_raises(self):
+        with self.assertRaises(ValueError):
+            Packet.from_json('{"type": "nope"}')
+
+
+if __name__ == '__main__':
+    unittest.main()